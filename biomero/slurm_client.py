@@ -15,10 +15,14 @@
 from typing import Dict, List, Optional, Tuple, Any
 from uuid import UUID
 from fabric import Connection, Result
-from fabric.transfer import Result as TransferResult
 from invoke.exceptions import UnexpectedExit
 from paramiko import SSHException
 import configparser
+import copy
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import queue
+import threading
 import re
 import requests_cache
 from requests.adapters import HTTPAdapter
@@ -40,6 +44,56 @@ from sqlalchemy.sql import text
 logger = logging.getLogger(__name__)
 
 
+class _BatchFuture:
+    """Placeholder result for a command queued inside a SlurmClient batch.
+
+    The actual output only becomes available after the batch is committed
+    (see `SlurmClient.batch`), which flushes all queued commands to Slurm
+    in a single SSH round-trip. Until then, `result()` raises.
+
+    Attributes:
+        done (bool): Whether the batch holding this future was committed.
+    """
+
+    def __init__(self, transform=None):
+        """
+        Initialize a _BatchFuture instance.
+
+        Args:
+            transform (callable, optional): A function applied to the raw
+                command output when the future is resolved. Defaults to None,
+                which keeps the raw output.
+        """
+        self._transform = transform
+        self._value = None
+        self.done = False
+
+    def resolve(self, output):
+        """
+        Resolve this future with the output of its command.
+
+        Args:
+            output: The raw output slice(s) of the queued command.
+        """
+        self._value = self._transform(output) if self._transform else output
+        self.done = True
+
+    def result(self):
+        """
+        Return the (transformed) output of the queued command.
+
+        Returns:
+            The command output, after the optional transform.
+
+        Raises:
+            RuntimeError: If the batch has not been committed yet.
+        """
+        if not self.done:
+            raise RuntimeError(
+                "Batch result not available yet; commit the batch first")
+        return self._value
+
+
 class SlurmJob:
     """Represents a job submitted to a Slurm cluster.
 
@@ -256,8 +310,19 @@ class SlurmClient(Connection):
     _DEFAULT_CONFIG_PATH_1 = "/etc/slurm-config.ini"
     _DEFAULT_CONFIG_PATH_2 = "/OMERO/slurm-config.ini"
     _DEFAULT_CONFIG_PATH_3 = "~/slurm-config.ini"
+    # Default config locations, with ~ expanded once at class creation
+    # instead of on every from_config call.
+    _CONFIG_CANDIDATES = (os.path.expanduser(_DEFAULT_CONFIG_PATH_1),
+                          os.path.expanduser(_DEFAULT_CONFIG_PATH_2),
+                          os.path.expanduser(_DEFAULT_CONFIG_PATH_3))
     _DEFAULT_HOST = "slurm"
     _DEFAULT_INLINE_SSH_ENV = True
+    # Pool of already-open clients, keyed by connection parameters.
+    # See from_config(reuse=True).
+    _CLIENT_POOL: Dict[Tuple, 'SlurmClient'] = {}
+    # Parsed configuration files, keyed by (path, mtime) pairs.
+    # See from_config.
+    _CONFIG_CACHE: Dict[Tuple, Dict] = {}
     _DEFAULT_SLURM_DATA_PATH = "my-scratch/data"
     _DEFAULT_SLURM_IMAGES_PATH = "my-scratch/singularity_images/workflows"
     _DEFAULT_SLURM_CONVERTERS_PATH = "my-scratch/singularity_images/converters"
@@ -280,6 +345,14 @@ class SlurmClient(Connection):
     _LOGFILE = "omero-{slurm_job_id}.log"
     _CONVERTER_LOGFILE = "\"slurm-{slurm_job_id}\"_*.out"
     _TAIL_LOG_CMD = "tail -n {n} \"{log_file}\" | strings"
+    # Pattern for extracting the job ID from sbatch output.
+    _SBATCH_JOB_RE = re.compile(r"Submitted batch job (\d+)")
+    # Default job-progress extraction, done remotely: only the last
+    # percentage match crosses the network instead of the whole log tail.
+    _PROGRESS_CMD = "grep -oE '[0-9]+%' \"{log_file}\" | tail -n 1"
+    # How long (seconds) to serve image versions / data listings from
+    # cache, see get_all_image_versions_and_data_files.
+    _IMAGE_CACHE_TTL = 30
     _LOGFILE_DATA_CMD = "cat \"{log_file}\" | perl -wne '/Running [\w-]+? Job w\/ .+? \| .+? \| (.+?) \|.*/i and print$1'"
 
     def __init__(self,
@@ -311,7 +384,8 @@ class SlurmClient(Connection):
                  sqlalchemy_url: str = None,
                  config_only: bool = False,
                  slurm_data_bind_path: str = None,
-                 slurm_conversion_partition: str = None):
+                 slurm_conversion_partition: str = None,
+                 compression: str = 'zip'):
         """
         Initializes a new instance of the SlurmClient class.
 
@@ -397,8 +471,12 @@ class SlurmClient(Connection):
             sqlalchemy_url (str, optional): URL for eventsourcing database 
                 connection. Defaults to None, which falls back to the
                 `SQLALCHEMY_URL` environment variable. Note that it will
-                always be overridden with the environment variable 
+                always be overridden with the environment variable
                 `SQLALCHEMY_URL`, if that is set.
+            compression (str, optional): The archive format for job output,
+                either 'zip' (single-threaded 7z) or 'tar.gz' (tar piped
+                through pigz, which compresses on all available cores).
+                Defaults to 'zip'.
         """
 
         super(SlurmClient, self).__init__(host,
@@ -410,6 +488,9 @@ class SlurmClient(Connection):
                                           connect_timeout,
                                           connect_kwargs,
                                           inline_ssh_env)
+        # Decode remote output as UTF-8 once, upstream in the runner,
+        # instead of re-encoding stdout on UnicodeEncodeError later.
+        self.config.run.encoding = 'utf-8'
         self.slurm_data_path = slurm_data_path
         self.slurm_images_path = slurm_images_path
         self.slurm_converters_path = slurm_converters_path
@@ -423,6 +504,18 @@ class SlurmClient(Connection):
         self.slurm_model_jobs_params = slurm_model_jobs_params
         self.slurm_data_bind_path = slurm_data_bind_path
         self.slurm_conversion_partition = slurm_conversion_partition
+        self.compression = compression
+
+        # Command batching, see batch()
+        self._pending: List[Tuple[List[str], _BatchFuture]] = []
+        self._batching = False
+
+        # Fire-and-forget queue, see submit_async / transfer_data_async
+        self._async_queue = None
+        self._async_worker = None
+
+        # TTL cache for get_all_image_versions_and_data_files
+        self._image_cache = None
 
         # Init cache. Keep responses for 360 seconds
         self.cache = requests_cache.backends.sqlite.SQLiteCache(
@@ -581,6 +674,19 @@ class SlurmClient(Connection):
                 logger.error(e)
                 session.rollback()
             
+    def __enter__(self):
+        """Open the SSH connection eagerly when entering the context.
+
+        Fabric opens the transport lazily on the first operation; opening
+        it here instead means every subsequent `run`/`put`/`get` reuses
+        the same transport and skips the TCP + SSH handshake.
+
+        Returns:
+            SlurmClient: This client, with an open connection.
+        """
+        self.open()
+        return self
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         # Ensure to call the parent class's __exit__ 
         # to clean up Connection resources
@@ -865,10 +971,29 @@ class SlurmClient(Connection):
         if not r.ok:
             raise SSHException(r)
 
+    @classmethod
+    def _pool_key(cls, host: str, user: str = None, port: int = None,
+                  connect_kwargs: dict = None) -> Tuple:
+        """Build a hashable pool key for the given connection parameters.
+
+        Args:
+            host (str): The hostname or IP address of the remote server.
+            user (str, optional): The username used to connect.
+            port (int, optional): The SSH port used to connect.
+            connect_kwargs (dict, optional): Additional keyword arguments
+                for the underlying SSH connection.
+
+        Returns:
+            Tuple: A hashable key identifying this connection.
+        """
+        frozen_kwargs = tuple(sorted((connect_kwargs or {}).items()))
+        return (host, user, port, frozen_kwargs)
+
     @classmethod
     def from_config(cls, configfile: str = '',
                     init_slurm: bool = False,
-                    config_only: bool = False) -> 'SlurmClient':
+                    config_only: bool = False,
+                    reuse: bool = False) -> 'SlurmClient':
         """Creates a new SlurmClient object using the parameters read from a
         configuration file (.ini).
 
@@ -886,18 +1011,92 @@ class SlurmClient(Connection):
             configfile (str): The path to your configuration file. Optional.
             init_slurm (bool): Initiate / validate slurm setup. Optional
                 Might take some time the first time with downloading, etc.
+            reuse (bool): Return a cached, already-open client for these
+                connection parameters if one exists, instead of opening a
+                new SSH connection. Optional.
 
         Returns:
             SlurmClient: A new SlurmClient object.
         """
+        if configfile:
+            config_paths = (*cls._CONFIG_CANDIDATES,
+                            os.path.expanduser(configfile))
+        else:
+            config_paths = cls._CONFIG_CANDIDATES
+        # Reuse the parsed configuration if none of the files changed,
+        # skipping the (slow) ConfigParser tokenization on repeat calls.
+        cache_key = cls._config_cache_key(config_paths)
+        cached = cls._CONFIG_CACHE.get(cache_key) if cache_key else None
+        if cached is not None:
+            logger.debug("Reusing cached slurm-config parse")
+            config_kwargs = copy.deepcopy(cached)
+        else:
+            config_kwargs = cls._parse_config(config_paths)
+            if cache_key:
+                cls._CONFIG_CACHE[cache_key] = copy.deepcopy(config_kwargs)
+
+        # Reuse a pooled, already-open client if requested, skipping the
+        # TCP handshake + SSH key exchange entirely. The config cache key
+        # is part of the pool key, so a changed ini never hands back a
+        # client that was configured from the old one.
+        host = config_kwargs['host']
+        pool_key = (cls._pool_key(host), cache_key)
+        if reuse:
+            pooled_client = cls._CLIENT_POOL.get(pool_key)
+            if pooled_client is not None and pooled_client.is_connected:
+                logger.info(f"Reusing pooled SlurmClient for {host}")
+                return pooled_client
+
+        # Create the SlurmClient object with the parameters read from
+        # the config file
+        client = cls(init_slurm=init_slurm,
+                     config_only=config_only,
+                     **config_kwargs)
+        if reuse:
+            if not client.is_connected:
+                client.open()
+            cls._CLIENT_POOL[pool_key] = client
+        return client
+
+    @classmethod
+    def _config_cache_key(cls, config_paths: Tuple[str, ...]) -> Optional[Tuple]:
+        """Build a cache key for the given config files based on mtime.
+
+        Args:
+            config_paths (Tuple[str, ...]): Candidate configuration file
+                paths.
+
+        Returns:
+            Optional[Tuple]: A tuple of (path, mtime) pairs, or None if
+                none of the files exist (in which case caching is skipped).
+        """
+        key = []
+        found = False
+        for path in config_paths:
+            try:
+                key.append((path, os.path.getmtime(path)))
+                found = True
+            except OSError:
+                key.append((path, None))
+        return tuple(key) if found else None
+
+    @classmethod
+    def _parse_config(cls, config_paths: Tuple[str, ...]) -> Dict[str, Any]:
+        """Parse the configuration files into SlurmClient parameters.
+
+        Args:
+            config_paths (Tuple[str, ...]): Candidate configuration file
+                paths, missing files are ok.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for the SlurmClient
+                constructor.
+        """
         # Load the configuration file
         configs = configparser.ConfigParser(allow_no_value=True)
         # Loads from default locations and given location, missing files are ok
-        configs.read([os.path.expanduser(cls._DEFAULT_CONFIG_PATH_1),
-                     os.path.expanduser(cls._DEFAULT_CONFIG_PATH_2),
-                     os.path.expanduser(cls._DEFAULT_CONFIG_PATH_3),
-                     os.path.expanduser(configfile)])
-        
+        configs.read(config_paths)
+
         # Read the required parameters from the configuration file,
         # fallback to defaults
         host = configs.get("SSH", "host", fallback=cls._DEFAULT_HOST)
@@ -917,6 +1116,9 @@ class SlurmClient(Connection):
         slurm_conversion_partition = configs.get(
             "SLURM", "slurm_conversion_partition",
             fallback= None)
+        compression = configs.get(
+            "SLURM", "compression",
+            fallback='zip')
 
         # Split the MODELS into paths, repos and images
         models_dict = dict(configs.items("MODELS"))
@@ -924,21 +1126,24 @@ class SlurmClient(Connection):
         slurm_model_repos = {}
         slurm_model_jobs = {}
         slurm_model_jobs_params = {}
+        # Single-pass suffix dispatch: one rpartition + dict lookup per key
+        # instead of multiple endswith checks and slices.
+        suffix_dispatch = {'repo': slurm_model_repos, 'job': slurm_model_jobs}
+        job_param_pattern = re.compile(r"(.+)_job_(.+)")
         for k, v in models_dict.items():
-            suffix_repo = '_repo'
-            suffix_job = '_job'
-            job_param_pattern = "(.+)_job_(.+)"
-            job_param_match = re.match(job_param_pattern, k)
-            if k.endswith(suffix_repo):
-                slurm_model_repos[k[:-len(suffix_repo)]] = v
-            elif k.endswith(suffix_job):
-                slurm_model_jobs[k[:-len(suffix_job)]] = v
-                slurm_model_jobs_params[k[:-len(suffix_job)]] = []
-            elif job_param_match:
-                slurm_model_jobs_params[job_param_match.group(1)].append(
-                    f" --{job_param_match.group(2)}={v}")
+            base, sep, suffix = k.rpartition('_')
+            target = suffix_dispatch.get(suffix) if sep else None
+            if target is not None:
+                target[base] = v
+                if suffix == 'job':
+                    slurm_model_jobs_params[base] = []
             else:
-                slurm_model_paths[k] = v
+                job_param_match = job_param_pattern.match(k)
+                if job_param_match:
+                    slurm_model_jobs_params[job_param_match.group(1)].append(
+                        f" --{job_param_match.group(2)}={v}")
+                else:
+                    slurm_model_paths[k] = v
         logger.info(f"Using job params: {slurm_model_jobs_params}")
 
         slurm_script_path = configs.get(
@@ -973,32 +1178,29 @@ class SlurmClient(Connection):
             enable_job_progress = True
             enable_workflow_analytics = True
             sqlalchemy_url = None
-        
-        # Create the SlurmClient object with the parameters read from
-        # the config file
-        return cls(host=host,
-                   inline_ssh_env=inline_ssh_env,
-                   slurm_data_path=slurm_data_path,
-                   slurm_images_path=slurm_images_path,
-                   slurm_converters_path=slurm_converters_path,
-                   slurm_model_paths=slurm_model_paths,
-                   slurm_model_repos=slurm_model_repos,
-                   slurm_model_images=None,
-                   converter_images=converter_images,
-                   slurm_model_jobs=slurm_model_jobs,
-                   slurm_model_jobs_params=slurm_model_jobs_params,
-                   slurm_script_path=slurm_script_path,
-                   slurm_script_repo=slurm_script_repo,
-                   init_slurm=init_slurm,
-                   # Pass analytics settings to the constructor
-                   track_workflows=track_workflows,
-                   enable_job_accounting=enable_job_accounting,
-                   enable_job_progress=enable_job_progress,
-                   enable_workflow_analytics=enable_workflow_analytics,
-                   sqlalchemy_url=sqlalchemy_url,
-                   config_only=config_only,
-                   slurm_data_bind_path=slurm_data_bind_path,
-                   slurm_conversion_partition=slurm_conversion_partition)
+
+        return dict(host=host,
+                    inline_ssh_env=inline_ssh_env,
+                    slurm_data_path=slurm_data_path,
+                    slurm_images_path=slurm_images_path,
+                    slurm_converters_path=slurm_converters_path,
+                    slurm_model_paths=slurm_model_paths,
+                    slurm_model_repos=slurm_model_repos,
+                    slurm_model_images=None,
+                    converter_images=converter_images,
+                    slurm_model_jobs=slurm_model_jobs,
+                    slurm_model_jobs_params=slurm_model_jobs_params,
+                    slurm_script_path=slurm_script_path,
+                    slurm_script_repo=slurm_script_repo,
+                    # Pass analytics settings to the constructor
+                    track_workflows=track_workflows,
+                    enable_job_accounting=enable_job_accounting,
+                    enable_job_progress=enable_job_progress,
+                    enable_workflow_analytics=enable_workflow_analytics,
+                    sqlalchemy_url=sqlalchemy_url,
+                    slurm_data_bind_path=slurm_data_bind_path,
+                    slurm_conversion_partition=slurm_conversion_partition,
+                    compression=compression)
 
     def cleanup_tmp_files(self,
                           slurm_job_id: str,
@@ -1069,8 +1271,11 @@ class SlurmClient(Connection):
         return result or None
 
     def validate(self, validate_slurm_setup: bool = False):
-        """Validate the connection to the Slurm cluster by running
-        a simple command.
+        """Validate the connection to the Slurm cluster.
+
+        When the SSH transport is already up this is just a liveness
+        check on the existing session; only when there is no active
+        transport does it fall back to running a command remotely.
 
         Args:
             validate_slurm_setup (bool): Whether to also check
@@ -1081,7 +1286,11 @@ class SlurmClient(Connection):
                 True if the validation is successful,
                 False otherwise.
         """
-        connected = self.run('echo " "').ok
+        transport = self.client.get_transport()
+        if transport is not None and transport.is_active():
+            connected = True
+        else:
+            connected = self.run('echo " "').ok
         if connected and validate_slurm_setup:
             try:
                 self.setup_slurm()
@@ -1090,6 +1299,68 @@ class SlurmClient(Connection):
                 return False
         return connected
 
+    # F-string command builders. These compile the command directly
+    # instead of re-parsing a {name} template on every call. The old
+    # class-level template constants are kept for back-compat.
+    @staticmethod
+    def _version_cmd(slurm_images_path: str, image_path: str) -> str:
+        """Build the command listing available image versions for a model."""
+        return (f"ls -h \"{slurm_images_path}/{image_path}\""
+                r" | grep -oP '(?<=\-|\_)(v.+|latest)(?=.simg|.sif)'")
+
+    @staticmethod
+    def _latest_version_cmd(slurm_images_path: str, image_path: str) -> str:
+        """Build the command returning only the latest image version.
+
+        ls -v sorts by version on the remote side and tail keeps the
+        last entry, so a single version string crosses the network
+        instead of the full list.
+        """
+        return (f"ls -v \"{slurm_images_path}/{image_path}\""
+                r" | grep -oP '(?<=\-|\_)(v.+|latest)(?=.simg|.sif)'"
+                " | tail -n 1")
+
+    @staticmethod
+    def _data_cmd(slurm_data_path: str) -> str:
+        """Build the command listing available (zipped) data files."""
+        return f"ls -h \"{slurm_data_path}\" | grep -oP '.+(?=.zip)' || :"
+
+    @staticmethod
+    def _all_jobs_cmd(start_time: str, end_time: str,
+                      states: str, columns: str) -> str:
+        """Build the sacct command listing jobs in a time window.
+
+        The output is piped through ``tac`` so jobs arrive most recent
+        first and no Python-side reversal is needed.
+        """
+        return (f"sacct --starttime {start_time} --endtime {end_time}"
+                f" --state {states} -o {columns} -n -X | tac")
+
+    @staticmethod
+    def _zip_cmd(filename: str, data_location: str) -> str:
+        """Build the command zipping a job's output folder."""
+        return f"7z a -y \"{filename}\" -tzip \"{data_location}/data/out\""
+
+    @staticmethod
+    def _targz_cmd(filename: str, data_location: str) -> str:
+        """Build the command tarring a job's output folder through pigz.
+
+        pigz compresses on all available cores, unlike the
+        single-threaded 7z zip path.
+        """
+        return (f"tar -C \"{data_location}/data\" -cf - out"
+                f" | pigz -p $(nproc) > \"{filename}.tar.gz\"")
+
+    @staticmethod
+    def _job_status_cmd(slurm_job_id: str) -> str:
+        """Build the sacct command for the status of the given job id(s)."""
+        return f"sacct -n -o JobId,State,End -X -j {slurm_job_id}"
+
+    @staticmethod
+    def _tail_log_cmd(n: int, log_file: str) -> str:
+        """Build the command tailing the last n lines of a log file."""
+        return f"tail -n {n} \"{log_file}\" | strings"
+
     def get_recent_log_command(self, log_file: str, n: int = 10) -> str:
         """
         Get the command to retrieve the recent log entries from a
@@ -1103,46 +1374,121 @@ class SlurmClient(Connection):
         Returns:
             str: The command to retrieve the recent log entries.
         """
-        return self._TAIL_LOG_CMD.format(n=n, log_file=log_file)
+        return self._tail_log_cmd(n=n, log_file=log_file)
 
     def get_active_job_progress(self,
                                 slurm_job_id: str,
-                                pattern: str = r"\d+%",
+                                pattern: Optional[str] = None,
                                 env: Optional[Dict[str, str]] = None) -> Any:
         """
         Get the progress of an active Slurm job from its logfiles.
 
         Args:
             slurm_job_id (str): The ID of the Slurm job.
-            pattern (str): The pattern to match in the job log to extract
-                the progress (default: r"\d+%").
+            pattern (str, optional): Optional override of the pattern to
+                match in the job log to extract the progress. Defaults to
+                None, which greps the last percentage match out of the
+                log on the remote side (see `_PROGRESS_CMD`).
 
-            env (Dict[str, str], optional): Optional environment variables 
+            env (Dict[str, str], optional): Optional environment variables
                 to set when running the command. Defaults to None.
 
         Returns:
             Any: The progress of the Slurm job according to the pattern, or None.
         """
-        cmdlist = []
-        cmd = self.get_recent_log_command(
-            log_file=self._LOGFILE.format(slurm_job_id=slurm_job_id))
-        cmdlist.append(cmd)
+        log_file = self._LOGFILE.format(slurm_job_id=slurm_job_id)
         if env is None:
             env = {}
+        if pattern is None:
+            # Grep the last match out of the log on the remote side, so
+            # only the tiny result crosses the network instead of the
+            # whole log tail.
+            cmd = self._PROGRESS_CMD.format(log_file=log_file)
+            try:
+                result = self.run_commands([cmd], env=env)
+                return result.stdout.strip() or None
+            except Exception as e:
+                logger.error(f"Issue with run command: {e}")
+                return None
+        # Custom pattern: ship the log tail and match it locally
+        cmdlist = [self.get_recent_log_command(log_file=log_file)]
         try:
             result = self.run_commands(cmdlist, env=env)
         except Exception as e:
             logger.error(f"Issue with run command: {e}")
-        # Match the specified pattern in the result's stdout
+        progress_re = re.compile(pattern)
         latest_progress = None
         try:
-            latest_progress = re.findall(
-                pattern, result.stdout)[-1]
+            # Keep only the last match while scanning; finditer avoids
+            # materializing a list of every match in a long log.
+            for match in progress_re.finditer(result.stdout):
+                latest_progress = match.group(0)
         except Exception as e:
             logger.warning(f"Issue with extracting progress: {e}")
 
         return latest_progress
 
+    def get_active_jobs_progress(self,
+                                 slurm_job_ids: List[str]
+                                 ) -> Dict[str, Any]:
+        """
+        Get the progress of multiple active Slurm jobs concurrently.
+
+        Each job's log is polled over its own SSH channel on the shared
+        transport, so the wall time is roughly one round-trip instead of
+        one per job.
+
+        Args:
+            slurm_job_ids (List[str]): The IDs of the Slurm jobs.
+
+        Returns:
+            Dict[str, Any]: The progress per job ID, or None where no
+                progress could be extracted.
+        """
+        if not slurm_job_ids:
+            return {}
+        cmds = [self._PROGRESS_CMD.format(
+                    log_file=self._LOGFILE.format(slurm_job_id=job_id))
+                for job_id in slurm_job_ids]
+        outputs = self._exec_parallel(cmds)
+        return {job_id: (output.strip() or None)
+                for job_id, output in zip(slurm_job_ids, outputs)}
+
+    def _exec_parallel(self, cmdlist: List[str]) -> List[str]:
+        """Run independent commands concurrently over the SSH transport.
+
+        Paramiko supports multiple channels per transport, so each command
+        gets its own session channel and they run in parallel on a thread
+        pool, bypassing Fabric's run() pipeline.
+
+        Args:
+            cmdlist (List[str]): The shell commands to run. The commands
+                must not depend on each other.
+
+        Returns:
+            List[str]: The stdout of each command, in input order.
+        """
+        self.open()
+        transport = self.client.get_transport()
+
+        def _exec(cmd):
+            channel = transport.open_session()
+            try:
+                channel.exec_command(cmd)
+                output = b""
+                while True:
+                    chunk = channel.recv(32768)
+                    if not chunk:
+                        break
+                    output += chunk
+                return output.decode('utf-8', 'ignore')
+            finally:
+                channel.close()
+
+        with ThreadPoolExecutor(
+                max_workers=min(16, len(cmdlist))) as executor:
+            return list(executor.map(_exec, cmdlist))
+
     def run_commands(self, cmdlist: List[str],
                      env: Optional[Dict[str, str]] = None,
                      sep: str = ' && ',
@@ -1159,7 +1505,7 @@ class SlurmClient(Connection):
             cmdlist (List[str]): A list of shell commands to run on Slurm.
             env (Dict[str, str], optional): Optional environment variables to
                 set when running the command. Defaults to None.
-            sep (str, optional): The separator used to concatenate the 
+            sep (str, optional): The separator used to concatenate the
                 commands. Defaults to ' && '.
             **kwargs: Additional keyword arguments.
 
@@ -1169,19 +1515,13 @@ class SlurmClient(Connection):
         if env is None:
             env = {}
         cmd = sep.join(cmdlist)
-        logger.info(
-            f"Running commands, with env {env} and sep {sep} \
-                and {kwargs}: {cmd}")
+        logger.debug(
+            "Running commands, with env %s and sep %s and %s: %s",
+            env, sep, kwargs, cmd)
         result = self.run(cmd, env=env, **kwargs)  # out_stream=out_stream,
-
-        try:
-            # Watch out for UnicodeEncodeError when you str() this.
-            logger.info(f"{result.stdout}")
-        except UnicodeEncodeError as e:
-            logger.error(f"Unicode error: {e}")
-            # TODO: ONLY stdout RECODE NEEDED?? or also error?
-            result.stdout = result.stdout.encode(
-                'utf-8', 'ignore').decode('utf-8')
+        # Output is decoded as UTF-8 by the runner (see __init__), so no
+        # encode/decode round-trip is needed here anymore.
+        logger.debug("%s", result.stdout)
         return result
 
     def str_to_class(self, module_name: str, class_name: str, *args, **kwargs):
@@ -1252,6 +1592,101 @@ class SlurmClient(Connection):
             logger.error(error)
             raise SSHException(error)
 
+    def begin_batch(self):
+        """Start queueing commands instead of running them directly.
+
+        While a batch is open, the batch-aware helpers (the job and
+        image/data listing methods) append their commands to a pending
+        queue and return `_BatchFuture` proxies. Other methods are
+        unaffected and keep running their commands immediately. Call
+        `commit_batch` to flush the whole queue to Slurm in a single
+        SSH round-trip and resolve the futures.
+        """
+        self._pending = []
+        self._batching = True
+
+    def commit_batch(self) -> List[Any]:
+        """Flush all queued commands in one SSH round-trip.
+
+        All pending commands are joined with the `_OUT_SEP` separator and
+        executed via a single `run_commands_split_out` call. Each queued
+        future is resolved with its own slice of the output.
+
+        Returns:
+            List[Any]: The resolved results, in the order they were queued.
+
+        Raises:
+            SSHException: If the combined command fails to execute.
+        """
+        pending, self._pending = self._pending, []
+        self._batching = False
+        if not pending:
+            return []
+        cmdlist = [cmd for cmds, _ in pending for cmd in cmds]
+        outputs = self.run_commands_split_out(cmdlist)
+        results = []
+        i = 0
+        for cmds, future in pending:
+            n = len(cmds)
+            future.resolve(outputs[i] if n == 1 else outputs[i:i + n])
+            i += n
+            results.append(future.result())
+        return results
+
+    @contextmanager
+    def batch(self):
+        """Context manager that batches commands into one SSH round-trip.
+
+        Commands issued within the context are queued and flushed as a
+        single remote invocation on exit, collapsing N SSH exchanges
+        into 1.
+
+        Example:
+            with slurmClient.batch():
+                active = slurmClient.list_active_jobs()
+                completed = slurmClient.list_completed_jobs()
+            # after the with-block, both futures are resolved
+            print(active.result(), completed.result())
+        """
+        self.begin_batch()
+        try:
+            yield self
+        except Exception:
+            # drop the queue, nothing was sent yet
+            self._pending = []
+            self._batching = False
+            raise
+        self.commit_batch()
+
+    def _queue_batch_command(self, cmdlist: List[str],
+                             transform=None,
+                             env: Optional[Dict[str, str]] = None
+                             ) -> _BatchFuture:
+        """Queue commands on the open batch and return a future for them.
+
+        Args:
+            cmdlist (List[str]): The shell commands to queue.
+            transform (callable, optional): Function applied to the output
+                when the batch is committed. Defaults to None.
+            env (Dict[str, str], optional): Not supported inside a batch;
+                the whole batch runs as one remote invocation, so
+                per-command environment variables cannot be applied.
+
+        Returns:
+            _BatchFuture: A future that resolves on `commit_batch`.
+
+        Raises:
+            ValueError: If `env` is passed, since it would be silently
+                dropped when the batch is flushed.
+        """
+        if env:
+            raise ValueError(
+                "env is not supported inside a batch; "
+                "run this command outside the batch instead")
+        future = _BatchFuture(transform=transform)
+        self._pending.append((cmdlist, future))
+        return future
+
     def list_active_jobs(self,
                          env: Optional[Dict[str, str]] = None) -> List[str]:
         """
@@ -1267,10 +1702,12 @@ class SlurmClient(Connection):
         # cmd = self._ACTIVE_JOBS_CMD
         cmd = self.get_jobs_info_command(start_time="now", states="r")
         logger.info("Retrieving list of active jobs from Slurm")
+        if self._batching:
+            return self._queue_batch_command([cmd],
+                                             transform=self._parse_job_list,
+                                             env=env)
         result = self.run_commands([cmd], env=env)
-        job_list = result.stdout.strip().split('\n')
-        job_list.reverse()
-        return job_list
+        return self._parse_job_list(result.stdout)
 
     def list_completed_jobs(self,
                             env: Optional[Dict[str, str]] = None) -> List[str]:
@@ -1287,10 +1724,12 @@ class SlurmClient(Connection):
 
         cmd = self.get_jobs_info_command(states="cd")
         logger.info("Retrieving a list of completed jobs from Slurm")
+        if self._batching:
+            return self._queue_batch_command([cmd],
+                                             transform=self._parse_job_list,
+                                             env=env)
         result = self.run_commands([cmd], env=env)
-        job_list = [job.strip() for job in result.stdout.strip().split('\n')]
-        job_list.reverse()
-        return job_list
+        return self._parse_job_list(result.stdout)
 
     def list_all_jobs(self, env: Optional[Dict[str, str]] = None) -> List[str]:
         """
@@ -1306,10 +1745,27 @@ class SlurmClient(Connection):
 
         cmd = self.get_jobs_info_command()
         logger.info("Retrieving a list of all jobs from Slurm")
+        if self._batching:
+            return self._queue_batch_command([cmd],
+                                             transform=self._parse_job_list,
+                                             env=env)
         result = self.run_commands([cmd], env=env)
-        job_list = result.stdout.strip().split('\n')
-        job_list.reverse()
-        return job_list
+        return self._parse_job_list(result.stdout)
+
+    @staticmethod
+    def _parse_job_list(stdout: str) -> List[str]:
+        """Parse sacct output into a list of job IDs.
+
+        The jobs info command already reverses the output remotely
+        (via ``tac``), so the IDs arrive most recent first.
+
+        Args:
+            stdout (str): The raw sacct output.
+
+        Returns:
+            List[str]: A list of job IDs.
+        """
+        return [job.strip() for job in stdout.strip().split('\n')]
 
     def get_jobs_info_command(self, start_time: str = "2023-01-01",
                               end_time: str = "now",
@@ -1339,26 +1795,106 @@ class SlurmClient(Connection):
                 A string representing the Slurm command to retrieve
                 information about old jobs.
         """
-        return self._ALL_JOBS_CMD.format(start_time=start_time,
-                                         end_time=end_time,
-                                         states=states,
-                                         columns=columns)
+        return self._all_jobs_cmd(start_time=start_time,
+                                  end_time=end_time,
+                                  states=states,
+                                  columns=columns)
 
-    def transfer_data(self, local_path: str) -> Result:
+    def transfer_data(self, local_path: str) -> Any:
         """
-        Transfers a file or directory from the local machine to the remote
+        Transfers a file from the local machine to the remote
         Slurm cluster.
 
+        The transfer goes over the cached SFTP channel directly, so
+        repeated transfers reuse one SFTP session instead of paying the
+        subsystem handshake per file.
+
         Args:
-            local_path (str): The local path to the file or directory to
-                transfer.
+            local_path (str): The local path to the file to transfer.
 
         Returns:
-            Result: The result of the file transfer operation.
+            Any: The SFTPAttributes of the transferred file.
         """
         logger.info(
             f"Transfering file {local_path} to {self.slurm_data_path}")
-        return self.put(local=local_path, remote=self.slurm_data_path)
+        # The upload changes the data listing, drop the cached one
+        self._image_cache = None
+        remote_path = f"{self.slurm_data_path}/{os.path.basename(local_path)}"
+        return self.sftp().put(localpath=local_path, remotepath=remote_path)
+
+    def transfer_data_async(self, local_path: str) -> Future:
+        """
+        Queue a data transfer to Slurm without blocking on its completion.
+
+        The transfer is performed by a background worker thread; callers
+        can pipeline many transfers and wait on the returned futures later.
+
+        Args:
+            local_path (str): The local path to the file or directory to
+                transfer.
+
+        Returns:
+            Future: A future that resolves with the result of the
+                transfer operation.
+        """
+        return self._enqueue_async(lambda: self.transfer_data(local_path))
+
+    def submit_async(self, sbatch_cmd: str,
+                     env: Optional[Dict[str, str]] = None) -> Future:
+        """
+        Submit a Slurm job without blocking on sbatch's output.
+
+        The command is queued for a background worker thread, which parses
+        the job ID out of the sbatch output once it arrives. Callers can
+        pipeline many submissions without paying a round-trip each.
+
+        Args:
+            sbatch_cmd (str): The sbatch command to run, e.g. from
+                `get_workflow_command`.
+            env (Dict[str, str], optional): Optional environment variables
+                to set when running the command. Defaults to None.
+
+        Returns:
+            Future: A future that resolves with the Slurm job ID, or -1
+                if no job ID could be extracted.
+        """
+        return self._enqueue_async(
+            lambda: self.extract_job_id(
+                self.run_commands([sbatch_cmd], env=env)))
+
+    def _enqueue_async(self, task) -> Future:
+        """Queue a task for the background worker and return its future.
+
+        Args:
+            task (callable): A no-argument callable to run on the worker.
+
+        Returns:
+            Future: A future resolved with the task's result, or its
+                exception if it raised.
+        """
+        if self._async_queue is None:
+            self._async_queue = queue.Queue()
+            self._async_worker = threading.Thread(
+                target=self._process_async_queue, daemon=True)
+            self._async_worker.start()
+        future = Future()
+        self._async_queue.put((task, future))
+        return future
+
+    def _process_async_queue(self):
+        """Consume queued tasks one at a time, resolving their futures.
+
+        Runs on a daemon thread; tasks are executed serially so queued
+        work never races on the shared SSH connection.
+        """
+        while True:
+            task, future = self._async_queue.get()
+            try:
+                future.set_result(task())
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                self._async_queue.task_done()
 
     def unpack_data(self, zipfile: str,
                     env: Optional[Dict[str, str]] = None) -> Result:
@@ -1376,6 +1912,8 @@ class SlurmClient(Connection):
         """
         cmd = self.get_unzip_command(zipfile)
         logger.info(f"Unpacking {zipfile} on Slurm")
+        # new data will appear, don't serve stale listings
+        self._image_cache = None
         return self.run_commands([cmd], env=env)
 
     def generate_slurm_job_for_workflow(self,
@@ -1450,6 +1988,9 @@ class SlurmClient(Connection):
         if not self.slurm_script_repo:
             generate_jobs = True
 
+        # scripts/workflows may change, don't serve stale listings
+        self._image_cache = None
+
         if generate_jobs:
             logger.info("Generating Slurm job scripts")
             for wf, job_path in self.slurm_model_jobs.items():
@@ -1521,9 +2062,8 @@ class SlurmClient(Connection):
             
         sbatch_cmd, sbatch_env = self.get_workflow_command(
             workflow_name, workflow_version, input_data, email, time, **kwargs)
-        print(f"Running {workflow_name} job on {input_data} on Slurm:\
-            {sbatch_cmd} w/ {sbatch_env}")
         logger.info(f"Running {workflow_name} job on {input_data} on Slurm")
+        logger.debug("Running: %s w/ %s", sbatch_cmd, sbatch_env)
         res = self.run_commands([sbatch_cmd], sbatch_env)
         slurm_job_id = self.extract_job_id(res)
         
@@ -1640,9 +2180,11 @@ class SlurmClient(Connection):
                 The Slurm job ID extracted from the result,
                 or -1 if not found.
         """
-        slurm_job_id = next((int(s.strip()) for s in result.stdout.split(
-                            "Submitted batch job") if s.strip().isdigit()), -1)
-        return slurm_job_id
+        try:
+            match = self._SBATCH_JOB_RE.search(result.stdout)
+        except TypeError:  # stdout is not a string (e.g. failed submit)
+            return -1
+        return int(match.group(1)) if match else -1
 
     def get_update_slurm_scripts_command(self) -> str:
         """Generate the command to update the Git repository containing
@@ -1686,7 +2228,7 @@ class SlurmClient(Connection):
         retry_status = 0
         while retry_status < 3:
             result = self.run_commands([cmd], env=env)
-            logger.info(result)
+            logger.debug("%s", result)
             if result.ok:
                 if not result.stdout:
                     # wait for 3 seconds before checking again
@@ -1751,12 +2293,12 @@ class SlurmClient(Connection):
             slurm_job_ids (List[int]): The job IDs of the jobs to check.
 
         Returns:
-            str: 
+            str:
                 The Slurm command to get the status of the jobs.
         """
-        # concat multiple jobs if needed
-        slurm_job_id = " -j ".join([str(id) for id in slurm_job_ids])
-        return self._JOB_STATUS_CMD.format(slurm_job_id=slurm_job_id)
+        # sacct takes a comma-separated id list, so one exec covers all jobs
+        slurm_job_id = ",".join([str(id) for id in slurm_job_ids])
+        return self._job_status_cmd(slurm_job_id=slurm_job_id)
 
     def extract_data_location_from_log(self, slurm_job_id: str = None,
                                        logfile: str = None) -> str:
@@ -2042,9 +2584,9 @@ class SlurmClient(Connection):
 
         email_param = "" if email is None else f" --mail-user={email}"
         time_param = "" if time is None else f" --time={time}"
-        job_params.append(time_param)
-        job_params.append(email_param)
-        job_param = "".join(job_params)
+        # Don't append to job_params: that would mutate the shared
+        # per-model list and grow the sbatch line on every call.
+        job_param = "".join(job_params) + time_param + email_param
         sbatch_cmd = f"sbatch{job_param} --output=omero-%j.log \
             \"{self.slurm_script_path}/{job_script}\""
 
@@ -2173,30 +2715,25 @@ class SlurmClient(Connection):
                                          use_gpu=use_gpu)
 
     def copy_zip_locally(self, local_tmp_storage: str, filename: str
-                         ) -> TransferResult:
+                         ) -> None:
         """ Copy a zip file from Slurm to the local server.
 
-        Note about (Transfer)Result:
-
-        Unlike similar classes such as invoke.runners.Result or
-        fabric.runners.Result
-        (which have a concept of “warn and return anyways on failure”)
-        this class has no useful truthiness behavior.
+        The transfer goes over the cached SFTP channel directly, reusing
+        one SFTP session across transfers.
         If a file transfer fails, some exception will be raised,
         either an OSError or an error from within Paramiko.
 
         Args:
             local_tmp_storage (String): Path to store the zip file locally.
             filename (String): Zip filename on Slurm.
-
-        Returns:
-            TransferResult: The result of the scp attempt.
         """
         logger.info(f"Copying zip {filename} from\
             Slurm to {local_tmp_storage}")
-        return self.get(
-            remote=f"{filename}.zip",
-            local=local_tmp_storage)
+        extension = 'tar.gz' if self.compression == 'tar.gz' else 'zip'
+        zipfile = f"{filename}.{extension}"
+        return self.sftp().get(
+            remotepath=zipfile,
+            localpath=os.path.join(local_tmp_storage, zipfile))
 
     def zip_data_on_slurm_server(self, data_location: str, filename: str,
                                  env: Optional[Dict[str, str]] = None
@@ -2222,6 +2759,10 @@ class SlurmClient(Connection):
         """
         Generate a command string for zipping the data on Slurm.
 
+        The archive format follows the `compression` setting of this
+        client: 'tar.gz' pipes tar through pigz for multi-core
+        compression, anything else uses the 7z zip command.
+
         Args:
             data_location (str): The folder to be zipped.
             filename (str): The name of the zip archive file to extract.
@@ -2230,44 +2771,43 @@ class SlurmClient(Connection):
         Returns:
             str: The command to create the zip file.
         """
-        return self._ZIP_CMD.format(filename=filename,
-                                    data_location=data_location)
+        if self.compression == 'tar.gz':
+            return self._targz_cmd(filename=filename,
+                                   data_location=data_location)
+        return self._zip_cmd(filename=filename,
+                             data_location=data_location)
 
     def get_logfile_from_slurm(self,
                                slurm_job_id: str,
                                local_tmp_storage: str = "/tmp/",
                                logfile: str = None
-                               ) -> Tuple[str, str, TransferResult]:
+                               ) -> Tuple[str, str, Any]:
         """Copy the logfile of the given SLURM job to the local server.
 
-        Note about (Transfer)Result:
-
-        Unlike similar classes such as invoke.runners.Result
-        or fabric.runners.Result
-        (which have a concept of “warn and return anyways on failure”)
-        this class has no useful truthiness behavior.
+        The transfer goes over the cached SFTP channel directly, reusing
+        one SFTP session across transfers (e.g. for batch log retrieval).
         If a file transfer fails, some exception will be raised,
         either an OSError or an error from within Paramiko.
 
         Args:
             slurm_job_id (str): The ID of the SLURM job.
-            local_tmp_storage (str, optional): Path to store the logfile 
+            local_tmp_storage (str, optional): Path to store the logfile
                 locally. Defaults to "/tmp/".
             logfile (str, optional): Path to the logfile on the SLURM server.
                 Defaults to None.
 
         Returns:
-            Tuple: directory, full path of the logfile, and TransferResult
+            Tuple: directory, full path of the logfile, and transfer result
         """
         if logfile is None:
             logfile = self._LOGFILE
         logfile = logfile.format(slurm_job_id=slurm_job_id)
         logger.info(f"Copying logfile {logfile} from Slurm\
             to {local_tmp_storage}")
-        result = self.get(
-            remote=logfile,
-            local=local_tmp_storage)
         export_file = local_tmp_storage+logfile
+        result = self.sftp().get(
+            remotepath=logfile,
+            localpath=export_file)
         return local_tmp_storage, export_file, result
 
     def get_unzip_command(self, zipfile: str,
@@ -2291,13 +2831,15 @@ class SlurmClient(Connection):
                 The command to extract the specified
                 filetypes from the zip file.
         """
-        unzip_cmd = f"mkdir \"{self.slurm_data_path}/{zipfile}\" \
-                    \"{self.slurm_data_path}/{zipfile}/data\" \
-                    \"{self.slurm_data_path}/{zipfile}/data/in\" \
-                    \"{self.slurm_data_path}/{zipfile}/data/out\" \
-                    \"{self.slurm_data_path}/{zipfile}/data/gt\"; \
-                    7z x -y -o\"{self.slurm_data_path}/{zipfile}/data/in\" \
-                    \"{self.slurm_data_path}/{zipfile}.zip\" {filter_filetypes}"
+        # mkdir -p creates the parent folders too, so one invocation
+        # covers the whole data tree; && makes sure 7z only runs into
+        # directories that actually exist.
+        base = f"{self.slurm_data_path}/{zipfile}"
+        unzip_cmd = f"mkdir -p \"{base}/data/in\" \
+\"{base}/data/out\" \
+\"{base}/data/gt\" \
+&& 7z x -y -o\"{base}/data/in\" \
+\"{base}.zip\" {filter_filetypes}"
 
         return unzip_cmd
 
@@ -2327,41 +2869,99 @@ class SlurmClient(Connection):
                 f"No path known for provided model {model}, \
                     in {self.slurm_model_paths}")
         cmdlist = [
-            self._VERSION_CMD.format(slurm_images_path=self.slurm_images_path,
-                                     image_path=image_path),
-            self._DATA_CMD.format(slurm_data_path=self.slurm_data_path)]
+            self._version_cmd(self.slurm_images_path, image_path),
+            self._data_cmd(self.slurm_data_path)]
+        if self._batching:
+            return self._queue_batch_command(
+                cmdlist, transform=self._parse_versions_and_data_files)
         # split responses per command
         response_list = self.run_commands_split_out(cmdlist)
+        return self._parse_versions_and_data_files(response_list)
+
+    @staticmethod
+    def _parse_versions_and_data_files(response_list: List[str]
+                                       ) -> Tuple[List[str], List[str]]:
+        """Parse the output slices of a version and a data listing command.
+
+        Args:
+            response_list (List[str]): The output per command, first the
+                image versions, then the data files.
+
+        Returns:
+            Tuple[List[str], List[str]]: The image versions (sorted in
+                descending order) and the data files.
+        """
         # split lines further into sublists
         response_list = [response.strip().split('\n')
                          for response in response_list]
         response_list[0] = sorted(response_list[0], reverse=True)
         return response_list[0], response_list[1]
 
+    def latest_image_version(self, model: str) -> Optional[str]:
+        """
+        Retrieve only the latest available image version for a model.
+
+        Unlike `get_image_versions_and_data_files`, the version sort and
+        selection happen on the remote side, so only one version string
+        is sent back instead of the whole list.
+
+        Args:
+            model (str): The name of the model to query for.
+
+        Returns:
+            Optional[str]: The latest image version, or None if no
+                versions are available.
+
+        Raises:
+            ValueError: If the provided model is not found in the
+                SlurmClient's known model paths.
+        """
+        image_path = self.slurm_model_paths.get(model)
+        if not image_path:
+            raise ValueError(
+                f"No path known for provided model {model}, \
+                    in {self.slurm_model_paths}")
+        cmd = self._latest_version_cmd(self.slurm_images_path, image_path)
+        result = self.run_commands([cmd])
+        return result.stdout.strip() or None
+
     def get_all_image_versions_and_data_files(self
                                               ) -> Tuple[Dict[str, List[str]],
                                                          List[str]]:
         """Retrieve all available image versions and data files from
         the Slurm cluster.
 
+        Results are served from a short-lived cache (`_IMAGE_CACHE_TTL`
+        seconds), so UI code that polls this to populate dropdowns does
+        not pay the SSH round-trips on every request. The cache is
+        invalidated when scripts are updated or new data is unpacked.
+
         Returns:
            Tuple[Dict[str, List[str]], List[str]]:
                 A tuple containing:
                 - A dictionary mapping models to available versions.
                 - A list of available input data folders.
         """
+        cache_key = (tuple(self.slurm_model_paths.items())
+                     if self.slurm_model_paths else (),
+                     self.slurm_data_path)
+        now = timesleep.monotonic()
+        if self._image_cache:
+            timestamp, key, cached = self._image_cache
+            if key == cache_key and now - timestamp < self._IMAGE_CACHE_TTL:
+                logger.debug("Serving image versions and data files "
+                             "from cache")
+                return copy.deepcopy(cached)
+
         resultdict = {}
         cmdlist = []
 
         for path in self.slurm_model_paths.values():
-            pathcmd = self._VERSION_CMD.format(
-                slurm_images_path=self.slurm_images_path,
-                image_path=path)
+            pathcmd = self._version_cmd(self.slurm_images_path, path)
             cmdlist.append(pathcmd)
 
         # Add data path too
-        cmdlist.append(self._DATA_CMD.format(
-            slurm_data_path=self.slurm_data_path))
+        cmdlist.append(self._data_cmd(self.slurm_data_path))
 
         # Split responses per command
         response_list = self.run_commands_split_out(cmdlist)
@@ -2374,4 +2974,6 @@ class SlurmClient(Connection):
             # Return highest version first
             resultdict[k] = sorted(response_list[i], reverse=True)
 
-        return resultdict, response_list[-1]
\ No newline at end of file
+        result = (resultdict, response_list[-1])
+        self._image_cache = (now, cache_key, copy.deepcopy(result))
+        return result
\ No newline at end of file
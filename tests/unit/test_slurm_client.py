@@ -109,6 +109,35 @@ def test_get_all_image_versions_and_data_files(mock_run_commands_split_out, slur
         [version_cmd_model1, version_cmd_model2, data_cmd])
 
 
+@patch.object(SlurmClient, 'run_commands_split_out')
+def test_get_all_image_versions_and_data_files_cached(
+        mock_run_commands_split_out, slurm_client):
+    """
+    Test that repeated listing calls are served from the TTL cache.
+    """
+    # GIVEN
+    slurm_client.slurm_images_path = "/path/to/slurm/images"
+    slurm_client.slurm_data_path = "/path/to/slurm/data"
+    slurm_client.slurm_model_paths = {"model1": "/path/to/models/model1"}
+    mock_run_commands_split_out.return_value = [
+        'version_output1', 'data_output']
+
+    # WHEN
+    first = slurm_client.get_all_image_versions_and_data_files()
+    second = slurm_client.get_all_image_versions_and_data_files()
+
+    # THEN
+    mock_run_commands_split_out.assert_called_once()
+    assert first == second
+
+    # WHEN the cache is invalidated (e.g. by unpacking new data)
+    slurm_client._image_cache = None
+    slurm_client.get_all_image_versions_and_data_files()
+
+    # THEN the listing is fetched again
+    assert mock_run_commands_split_out.call_count == 2
+
+
 def test_get_image_versions_and_data_files(slurm_client):
     # GIVEN
     model = "example_model"
@@ -143,6 +172,33 @@ def test_get_image_versions_and_data_files(slurm_client):
         slurm_client.get_image_versions_and_data_files("nonexistent_model")
 
 
+@patch.object(SlurmClient, 'run_commands')
+def test_latest_image_version(mock_run_commands, slurm_client):
+    """
+    Test retrieving only the latest image version for a model.
+    """
+    # GIVEN
+    model = "example_model"
+    model_path = '/path/to/models/example_model'
+    slurm_client.slurm_images_path = "/path/to/slurm/images"
+    slurm_client.slurm_model_paths = {model: model_path}
+    mock_run_commands.return_value = SerializableMagicMock(
+        ok=True, stdout="v1.2.3\n")
+
+    # WHEN
+    version = slurm_client.latest_image_version(model)
+
+    # THEN
+    assert version == "v1.2.3"
+    mock_run_commands.assert_called_once_with(
+        [slurm_client._latest_version_cmd(
+            slurm_client.slurm_images_path, model_path)])
+
+    # WHEN & THEN
+    with pytest.raises(ValueError, match="No path known for provided model"):
+        slurm_client.latest_image_version("nonexistent_model")
+
+
 def test_get_unzip_command(slurm_client):
     # GIVEN
     slurm_data_path = "/path/to/slurm/data"
@@ -150,13 +206,11 @@ def test_get_unzip_command(slurm_client):
     zipfile = "example"
     filter_filetypes = "*.zarr *.tiff *.tif"
     expected_command = (
-        f"mkdir \"{slurm_data_path}/{zipfile}\" \
-                    \"{slurm_data_path}/{zipfile}/data\" \
-                    \"{slurm_data_path}/{zipfile}/data/in\" \
-                    \"{slurm_data_path}/{zipfile}/data/out\" \
-                    \"{slurm_data_path}/{zipfile}/data/gt\"; \
-                    7z x -y -o\"{slurm_data_path}/{zipfile}/data/in\" \
-                    \"{slurm_data_path}/{zipfile}.zip\" {filter_filetypes}"
+        f"mkdir -p \"{slurm_data_path}/{zipfile}/data/in\" "
+        f"\"{slurm_data_path}/{zipfile}/data/out\" "
+        f"\"{slurm_data_path}/{zipfile}/data/gt\" "
+        f"&& 7z x -y -o\"{slurm_data_path}/{zipfile}/data/in\" "
+        f"\"{slurm_data_path}/{zipfile}.zip\" {filter_filetypes}"
     )
 
     # WHEN
@@ -167,25 +221,27 @@ def test_get_unzip_command(slurm_client):
     assert unzip_command == expected_command
 
 
-@patch.object(SlurmClient, 'get')
-def test_get_logfile_from_slurm(mock_get, slurm_client):
+@patch.object(SlurmClient, 'sftp')
+def test_get_logfile_from_slurm(mock_sftp, slurm_client):
     # GIVEN
     slurm_job_id = "12345"
     local_tmp_storage = "/tmp/"
     logfile = "/path/to/logfile.log"
+    mock_get = mock_sftp.return_value.get
 
     # Case 1: Logfile is provided
     _, _, result = slurm_client.get_logfile_from_slurm(
         slurm_job_id, local_tmp_storage, logfile)
     mock_get.assert_called_once_with(
-        remote=logfile, local=f"{local_tmp_storage}")
+        remotepath=logfile, localpath=f"{local_tmp_storage}{logfile}")
 
     # Case 2: Logfile is not provided, and default logfile is used
     _, _, result = slurm_client.get_logfile_from_slurm(
         slurm_job_id, local_tmp_storage)
     default_logfile = slurm_client._LOGFILE.format(slurm_job_id=slurm_job_id)
     mock_get.assert_called_with(
-        remote=default_logfile, local=f"{local_tmp_storage}")
+        remotepath=default_logfile,
+        localpath=f"{local_tmp_storage}{default_logfile}")
 
     # Case 3: Logfile is not provided, and default logfile is changed
     slurm_client._LOGFILE = "/custom/logfile.log"
@@ -193,7 +249,8 @@ def test_get_logfile_from_slurm(mock_get, slurm_client):
         slurm_job_id, local_tmp_storage)
     custom_logfile = slurm_client._LOGFILE.format(slurm_job_id=slurm_job_id)
     mock_get.assert_called_with(
-        remote=custom_logfile, local=f"{local_tmp_storage}")
+        remotepath=custom_logfile,
+        localpath=f"{local_tmp_storage}{custom_logfile}")
 
 
 @patch('biomero.slurm_client.logger')
@@ -216,24 +273,47 @@ def test_zip_data_on_slurm_server(mock_run_commands, mock_logger, slurm_client):
 
 
 @patch('biomero.slurm_client.logger')
-@patch.object(SlurmClient, 'get', return_value=SerializableMagicMock(ok=True, stdout=""))
-def test_copy_zip_locally(mock_get, mock_logger, slurm_client):
+@patch.object(SlurmClient, 'sftp')
+def test_copy_zip_locally(mock_sftp, mock_logger, slurm_client):
     # GIVEN
     local_tmp_storage = "/local/path/to/store"
     filename = "example_zip"
 
     # WHEN
-    result = slurm_client.copy_zip_locally(local_tmp_storage, filename)
+    slurm_client.copy_zip_locally(local_tmp_storage, filename)
 
     # THEN
-    mock_get.assert_called_once_with(
-        remote=f"{filename}.zip", local=local_tmp_storage)
-    assert result.ok is True
-    assert result.stdout == ""
+    mock_sftp.return_value.get.assert_called_once_with(
+        remotepath=f"{filename}.zip",
+        localpath=os.path.join(local_tmp_storage, f"{filename}.zip"))
     mock_logger.info.assert_called_with(f'Copying zip {filename} from\
             Slurm to {local_tmp_storage}')
 
 
+@patch('biomero.slurm_client.logger')
+@patch.object(SlurmClient, 'sftp')
+@patch.object(SlurmClient, 'run_commands', return_value=SerializableMagicMock(ok=True, stdout=""))
+def test_zip_data_targz_compression(mock_run_commands, mock_sftp,
+                                    mock_logger, slurm_client):
+    # GIVEN a client configured for parallel tar.gz compression
+    slurm_client.compression = 'tar.gz'
+    data_location = "/local/path/to/store"
+    local_tmp_storage = "/local/path/to/store"
+    filename = "example_zip"
+
+    # WHEN
+    slurm_client.zip_data_on_slurm_server(data_location, filename)
+    slurm_client.copy_zip_locally(local_tmp_storage, filename)
+
+    # THEN the archive is built with tar | pigz and fetched as .tar.gz
+    mock_run_commands.assert_called_once_with(
+        [f"tar -C \"{data_location}/data\" -cf - out"
+         f" | pigz -p $(nproc) > \"{filename}.tar.gz\""], env=None)
+    mock_sftp.return_value.get.assert_called_once_with(
+        remotepath=f"{filename}.tar.gz",
+        localpath=os.path.join(local_tmp_storage, f"{filename}.tar.gz"))
+
+
 @pytest.mark.parametrize("email, time_limit", [("", ""), ("user@example.com", "10:00:00")])
 def test_get_workflow_command(slurm_client,
                               email,
@@ -274,6 +354,31 @@ def test_get_workflow_command(slurm_client,
     assert env == expected_env
 
 
+def test_get_workflow_command_repeated_calls(slurm_client):
+    """
+    Test that building a workflow command does not mutate the shared
+    per-model job params, so repeated submissions stay identical.
+    """
+    # GIVEN
+    workflow = "example_workflow"
+    slurm_client.slurm_model_paths = {"example_workflow": "workflow_path"}
+    slurm_client.slurm_model_jobs = {"example_workflow": "job_script.sh"}
+    slurm_client.slurm_model_jobs_params = {
+        "example_workflow": [" --param3=value3"]}
+    slurm_client.slurm_model_images = {"example_workflow": "user/image"}
+
+    # WHEN
+    first_cmd, _ = slurm_client.get_workflow_command(
+        workflow, "1.0", "input_data_folder", "user@example.com", "10:00:00")
+    second_cmd, _ = slurm_client.get_workflow_command(
+        workflow, "1.0", "input_data_folder", "user@example.com", "10:00:00")
+
+    # THEN
+    assert first_cmd == second_cmd
+    assert slurm_client.slurm_model_jobs_params["example_workflow"] == [
+        " --param3=value3"]
+
+
 @pytest.mark.parametrize("source_format, target_format", [("zarr", "tiff"), ("xyz", "abc")])
 @patch('biomero.slurm_client.SlurmClient.run_commands', new_callable=SerializableMagicMock)
 @patch('fabric.Result', new_callable=SerializableMagicMock)
@@ -627,7 +732,7 @@ def test_get_job_status_command(slurm_client):
     command = slurm_client.get_job_status_command(slurm_job_ids)
 
     # THEN
-    expected_command = 'sacct -n -o JobId,State,End -X -j 123 -j 456 -j 789'
+    expected_command = 'sacct -n -o JobId,State,End -X -j 123,456,789'
     assert command == expected_command
 
 
@@ -643,7 +748,7 @@ def test_check_job_status(mock_run_commands,
 
     # THEN
     mock_run_commands.assert_called_with(
-        ['sacct -n -o JobId,State,End -X -j 12345 -j 67890'], env=None)
+        ['sacct -n -o JobId,State,End -X -j 12345,67890'], env=None)
     assert job_status_dict == {12345: 'RUNNING', 67890: 'COMPLETED'}
     
     
@@ -706,7 +811,7 @@ def test_check_job_array_status(mock_run_commands, slurm_client):
 
     # THEN
     mock_run_commands.assert_called_with(
-        ['sacct -n -o JobId,State,End -X -j 2304 -j 2339'], env=None)
+        ['sacct -n -o JobId,State,End -X -j 2304,2339'], env=None)
 
     expected_status_dict = {2304: 'COMPLETED', 2339: 'PENDING'}
     assert job_status_dict == expected_status_dict
@@ -728,7 +833,7 @@ def test_check_job_status_exc(mock_run_commands,
 
     # THEN
     mock_run_commands.assert_called_with(
-        ['sacct -n -o JobId,State,End -X -j 12345 -j 67890'], env=None)
+        ['sacct -n -o JobId,State,End -X -j 12345,67890'], env=None)
     mock_logger.error.assert_called_with(f'Result is not ok: {return_mock}')
 
 
@@ -747,7 +852,7 @@ def test_check_job_status_exc2(mock_run_commands, _mock_timesleep,
 
     # THEN
     mock_run_commands.assert_called_with(
-        ['sacct -n -o JobId,State,End -X -j 12345 -j 67890'], env=None)
+        ['sacct -n -o JobId,State,End -X -j 12345,67890'], env=None)
     mock_logger.error.assert_called_with(
         'Error: Retried 3 times to get                 status of [12345, 67890], but no response.')
 
@@ -854,7 +959,7 @@ def test_list_completed_jobs(mock_run_commands,
         env=env
     )
 
-    assert result == ["43210", "98765"]
+    assert result == ["98765", "43210"]
 
 
 @patch('biomero.slurm_client.SlurmClient.run_commands')
@@ -880,7 +985,7 @@ def test_list_active_jobs(mock_run_commands,
         env=env
     )
 
-    assert result == ["67890", "12345"]
+    assert result == ["12345", "67890"]
 
 
 @patch('biomero.slurm_client.SlurmClient.run')
@@ -910,6 +1015,113 @@ def test_run_commands(mock_run, slurm_client):
     assert result.stdout == "Command executed successfully"
 
 
+def test_enter_opens_connection_eagerly(slurm_client):
+    """
+    Test that entering the context manager opens the SSH connection.
+    """
+    # GIVEN
+    with patch.object(SlurmClient, 'open') as mock_open:
+        # WHEN
+        client = slurm_client.__enter__()
+
+        # THEN
+        mock_open.assert_called_once_with()
+        assert client is slurm_client
+
+
+def test_from_config_reuse_returns_pooled_client(tmp_path):
+    """
+    Test that from_config(reuse=True) returns a cached, connected client.
+    """
+    # GIVEN
+    configfile = tmp_path / "slurm-config.ini"
+    configfile.write_text(
+        "[SSH]\n"
+        "host=testhost\n"
+        "[MODELS]\n"
+        "m1=v1\n"
+    )
+    pooled_client = MagicMock()
+    pooled_client.is_connected = True
+    config_paths = (*SlurmClient._CONFIG_CANDIDATES, str(configfile))
+    pool_key = (SlurmClient._pool_key("testhost"),
+                SlurmClient._config_cache_key(config_paths))
+    SlurmClient._CLIENT_POOL[pool_key] = pooled_client
+
+    try:
+        # WHEN
+        client = SlurmClient.from_config(configfile=str(configfile),
+                                         reuse=True)
+
+        # THEN
+        assert client is pooled_client
+    finally:
+        SlurmClient._CLIENT_POOL.clear()
+        SlurmClient._CONFIG_CACHE.clear()
+
+
+@patch('biomero.slurm_client.SlurmClient.run_commands_split_out')
+def test_batch_collapses_commands(mock_run_commands_split_out, slurm_client):
+    """
+    Test that commands issued inside a batch are flushed as one round-trip.
+    """
+    # GIVEN
+    active_cmd = slurm_client.get_jobs_info_command(
+        start_time="now", states="r")
+    completed_cmd = slurm_client.get_jobs_info_command(states="cd")
+    mock_run_commands_split_out.return_value = [
+        "12345\n67890\n", "11111\n22222\n"]
+
+    # WHEN
+    with slurm_client.batch():
+        active = slurm_client.list_active_jobs()
+        completed = slurm_client.list_completed_jobs()
+        # not resolved until the batch is committed
+        with pytest.raises(RuntimeError):
+            active.result()
+
+    # THEN
+    mock_run_commands_split_out.assert_called_once_with(
+        [active_cmd, completed_cmd])
+    assert active.result() == ["12345", "67890"]
+    assert completed.result() == ["11111", "22222"]
+
+
+@patch('biomero.slurm_client.SlurmClient.run')
+def test_batch_leaves_run_commands_untouched(mock_run, slurm_client):
+    """
+    Test that run_commands still executes immediately while a batch is
+    open, so env-carrying calls (e.g. job submission) are never queued.
+    """
+    # GIVEN
+    env = {"VAR1": "value1"}
+    mock_run.return_value = SerializableMagicMock(ok=True, stdout="")
+
+    # WHEN
+    slurm_client.begin_batch()
+    result = slurm_client.run_commands(["echo 'command1'"], env=env)
+    results = slurm_client.commit_batch()
+
+    # THEN the command ran directly, nothing was queued
+    mock_run.assert_called_once_with("echo 'command1'", env=env)
+    assert result.ok is True
+    assert results == []
+
+
+def test_batch_rejects_env_on_queued_commands(slurm_client):
+    """
+    Test that queueing a command with env inside a batch raises, instead
+    of silently dropping the environment variables.
+    """
+    # GIVEN
+    slurm_client.begin_batch()
+
+    # WHEN / THEN
+    with pytest.raises(ValueError):
+        slurm_client.list_active_jobs(env={"VAR1": "value1"})
+    slurm_client.commit_batch()
+
+
 @patch('biomero.slurm_client.SlurmClient.run_commands')
 @patch('biomero.slurm_client.SlurmClient.get_recent_log_command')
 def test_get_active_job_progress(mock_get_recent_log_command,
@@ -942,6 +1154,86 @@ def test_get_active_job_progress(mock_get_recent_log_command,
     assert result == "75%"
 
 
+@patch('biomero.slurm_client.SlurmClient.run_commands')
+def test_submit_async(mock_run_commands, slurm_client):
+    """
+    Test that submit_async resolves with the job ID without blocking.
+    """
+    # GIVEN
+    sbatch_cmd = "sbatch job_script.sh"
+    env = {"VAR1": "value1"}
+    mock_run_commands.return_value = SerializableMagicMock(
+        ok=True, stdout="Submitted batch job 12345")
+
+    # WHEN
+    future = slurm_client.submit_async(sbatch_cmd, env=env)
+
+    # THEN
+    assert future.result(timeout=5) == 12345
+    mock_run_commands.assert_called_once_with([sbatch_cmd], env=env)
+
+
+@patch('biomero.slurm_client.SlurmClient.transfer_data')
+def test_transfer_data_async(mock_transfer_data, slurm_client):
+    """
+    Test that transfer_data_async queues the transfer on the worker.
+    """
+    # GIVEN
+    local_path = "/local/path/to/data"
+    transfer_result = SerializableMagicMock(ok=True)
+    mock_transfer_data.return_value = transfer_result
+
+    # WHEN
+    future = slurm_client.transfer_data_async(local_path)
+
+    # THEN
+    assert future.result(timeout=5) is transfer_result
+    mock_transfer_data.assert_called_once_with(local_path)
+
+
+@patch('biomero.slurm_client.SlurmClient._exec_parallel')
+def test_get_active_jobs_progress(mock_exec_parallel, slurm_client):
+    """
+    Test getting the progress of multiple jobs in one parallel fan-out.
+    """
+    # GIVEN
+    slurm_job_ids = ["12345", "67890"]
+    expected_cmds = [
+        slurm_client._PROGRESS_CMD.format(
+            log_file=slurm_client._LOGFILE.format(slurm_job_id=job_id))
+        for job_id in slurm_job_ids]
+    mock_exec_parallel.return_value = ["50%\n", "\n"]
+
+    # WHEN
+    result = slurm_client.get_active_jobs_progress(slurm_job_ids)
+
+    # THEN
+    mock_exec_parallel.assert_called_once_with(expected_cmds)
+    assert result == {"12345": "50%", "67890": None}
+
+
+@patch('biomero.slurm_client.SlurmClient.run_commands')
+def test_get_active_job_progress_remote_grep(mock_run_commands, slurm_client):
+    """
+    Test that the default progress poll greps the log on the remote side.
+    """
+    # GIVEN
+    slurm_job_id = "12345"
+    log_file = slurm_client._LOGFILE.format(slurm_job_id=slurm_job_id)
+
+    # Mocking the run_commands method
+    mock_run_commands.return_value = SerializableMagicMock(
+        ok=True, stdout="75%\n")
+
+    # WHEN
+    result = slurm_client.get_active_job_progress(slurm_job_id)
+
+    # THEN
+    mock_run_commands.assert_called_once_with(
+        [slurm_client._PROGRESS_CMD.format(log_file=log_file)], env={})
+    assert result == "75%"
+
+
 @patch('biomero.slurm_client.SlurmClient.run_commands')
 @patch('biomero.slurm_client.SlurmClient.extract_data_location_from_log')
 def test_cleanup_tmp_files_loc(mock_extract_data_location, mock_run_commands,
@@ -1276,12 +1568,10 @@ def test_from_config(mock_ConfigParser,
         configfile=configfile, init_slurm=init_slurm, config_only=config_only)
 
     # THEN
-    mock_configparser_instance.read.assert_called_once_with([
-        os.path.expanduser(SlurmClient._DEFAULT_CONFIG_PATH_1),
-        os.path.expanduser(SlurmClient._DEFAULT_CONFIG_PATH_2),
-        os.path.expanduser(SlurmClient._DEFAULT_CONFIG_PATH_3),
+    mock_configparser_instance.read.assert_called_once_with((
+        *SlurmClient._CONFIG_CANDIDATES,
         os.path.expanduser(configfile)
-    ])
+    ))
     mock_SlurmClient.assert_called_with(
         host=mv,  # expected host value,
         inline_ssh_env=True,  # expected inline_ssh_env value,
@@ -1302,11 +1592,45 @@ def test_from_config(mock_ConfigParser,
         enable_job_progress=True,  # expected enable_job_progress value
         enable_workflow_analytics=True,  # expected enable_workflow_analytics value
         sqlalchemy_url='sqlite:///test.db',  # expected sqlalchemy_url value
-        config_only=config_only
+        config_only=config_only,
+        slurm_data_bind_path=mv,  # expected slurm_data_bind_path value,
+        slurm_conversion_partition=mv,  # expected partition value,
+        compression=mv  # expected compression value
     )
 
 
    
+@patch('biomero.slurm_client.SlurmClient.__init__', return_value=None)
+def test_from_config_caches_parsed_config(_mock_init, tmp_path):
+    """
+    Test that from_config only re-parses the config when a file changed.
+    """
+    # GIVEN
+    configfile = tmp_path / "slurm-config.ini"
+    configfile.write_text(
+        "[SSH]\n"
+        "host=testhost\n"
+        "[MODELS]\n"
+        "m1=v1\n"
+        "m1_repo=https://github.com/example/m1\n"
+        "m1_job=job1\n"
+    )
+    SlurmClient._CONFIG_CACHE.clear()
+
+    try:
+        with patch.object(SlurmClient, '_parse_config',
+                          wraps=SlurmClient._parse_config) as mock_parse:
+            # WHEN
+            SlurmClient.from_config(configfile=str(configfile))
+            SlurmClient.from_config(configfile=str(configfile))
+
+            # THEN
+            # second call is served from the mtime-keyed cache
+            assert mock_parse.call_count == 1
+    finally:
+        SlurmClient._CONFIG_CACHE.clear()
+
+
 def test_parse_docker_image_with_version(slurm_client):
     version, image_name = slurm_client.parse_docker_image_version("example_image:1.0")
     assert version == "1.0"
@@ -1462,6 +1786,27 @@ def test_validate_no_setup(mock_setup_slurm, mock_run, slurm_client):
     assert result is True
 
 
+@patch('biomero.slurm_client.SlurmClient.run')
+@patch('biomero.slurm_client.SlurmClient.setup_slurm')
+def test_validate_active_transport_skips_run(mock_setup_slurm, mock_run,
+                                             slurm_client):
+    """
+    Test that validation uses the live transport instead of a remote command.
+    """
+    # GIVEN an already-active SSH transport
+    mock_transport = mock.MagicMock()
+    mock_transport.is_active.return_value = True
+
+    with mock.patch.object(slurm_client.client, 'get_transport',
+                           return_value=mock_transport):
+        # WHEN
+        result = slurm_client.validate(validate_slurm_setup=False)
+
+    # THEN no remote command was needed
+    mock_run.assert_not_called()
+    assert result is True
+
+
 @patch('biomero.slurm_client.SlurmClient.run')
 @patch('biomero.slurm_client.SlurmClient.setup_slurm')
 def test_validate_connection_failure(mock_setup_slurm, mock_run, slurm_client):